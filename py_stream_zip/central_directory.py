@@ -1,5 +1,18 @@
 import struct
-from . import constants, utils
+from . import constants
+
+# Fixed-size record layouts, unpacked in a single call (the leading signature is skipped).
+# EOCD: entries on disk, total entries, CD size, CD offset, comment length.
+_EOCD_STRUCT = struct.Struct("<8xHHIIH")
+# ZIP64 EOCD locator: offset of the ZIP64 EOCD header.
+_ENDL64_STRUCT = struct.Struct("<8xQ")
+# ZIP64 EOCD: entries on disk, total entries, CD size, CD offset.
+_END64_STRUCT = struct.Struct("<24xQQQQ")
+
+# Record signatures as raw bytes, so validation is a plain 4-byte comparison.
+_ENDSIG_BYTES = constants.ENDSIG.to_bytes(4, "little")
+_ENDL64SIG_BYTES = constants.ENDL64SIG.to_bytes(4, "little")
+_END64SIG_BYTES = constants.END64SIG.to_bytes(4, "little")
 
 
 class CentralDirectoryHeader:
@@ -21,16 +34,15 @@ class CentralDirectoryHeader:
           4. Read the size and offset of the central directory.
           5. Extract the length of the ZIP comment.
         """
-        if (
-            len(data) != constants.ENDHDR
-            or utils.read_uint32_le(data, 0) != constants.ENDSIG
-        ):
+        if len(data) != constants.ENDHDR or data[:4] != _ENDSIG_BYTES:
             raise ValueError("Invalid central directory header")
-        self.volume_entries = struct.unpack_from("<H", data, constants.ENDSUB)[0]
-        self.total_entries = struct.unpack_from("<H", data, constants.ENDTOT)[0]
-        self.size = utils.read_uint32_le(data, constants.ENDSIZ)
-        self.offset = utils.read_uint32_le(data, constants.ENDOFF)
-        self.comment_length = struct.unpack_from("<H", data, constants.ENDCOM)[0]
+        (
+            self.volume_entries,
+            self.total_entries,
+            self.size,
+            self.offset,
+            self.comment_length,
+        ) = _EOCD_STRUCT.unpack_from(data, 0)
 
 
 class CentralDirectoryLoc64Header:
@@ -45,12 +57,9 @@ class CentralDirectoryLoc64Header:
           1. Verify that the data size and signature are correct.
           2. Read the offset to the ZIP64 EOCD header.
         """
-        if (
-            len(data) != constants.ENDL64HDR
-            or utils.read_uint32_le(data, 0) != constants.ENDL64SIG
-        ):
+        if len(data) != constants.ENDL64HDR or data[:4] != _ENDL64SIG_BYTES:
             raise ValueError("Invalid zip64 central directory locator")
-        self.header_offset = utils.read_uint64_le(data, constants.ENDSUB)
+        (self.header_offset,) = _ENDL64_STRUCT.unpack_from(data, 0)
 
 
 class CentralDirectoryZip64Header:
@@ -69,12 +78,11 @@ class CentralDirectoryZip64Header:
           2. Extract the number of entries on this disk and total across the ZIP.
           3. Read the size and starting offset of the central directory.
         """
-        if (
-            len(data) != constants.END64HDR
-            or utils.read_uint32_le(data, 0) != constants.END64SIG
-        ):
+        if len(data) != constants.END64HDR or data[:4] != _END64SIG_BYTES:
             raise ValueError("Invalid zip64 central directory header")
-        self.volume_entries = utils.read_uint64_le(data, constants.END64SUB)
-        self.total_entries = utils.read_uint64_le(data, constants.END64TOT)
-        self.size = utils.read_uint64_le(data, constants.END64SIZ)
-        self.offset = utils.read_uint64_le(data, constants.END64OFF)
+        (
+            self.volume_entries,
+            self.total_entries,
+            self.size,
+            self.offset,
+        ) = _END64_STRUCT.unpack_from(data, 0)
@@ -1,15 +1,37 @@
+import mmap
 import os
 import struct
+import threading
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 
 from . import constants, utils
-from .zip_entry import ZipEntry
+from .zip_entry import _LOCSIG_BYTES, ZipEntry
 from .central_directory import (
+    _ENDSIG_BYTES,
     CentralDirectoryHeader,
     CentralDirectoryLoc64Header,
     CentralDirectoryZip64Header,
 )
 
+try:
+    # Optional accelerator: ISA-L's zlib-compatible DEFLATE decoder (python-isal).
+    from isal import isal_zlib as _inflate_zlib
+except ImportError:
+    _inflate_zlib = zlib
+
+_HAS_PREAD = hasattr(os, "pread")  # not available on Windows
+
+# Maximum size of the EOCD record plus its comment.
+_EOCD_SEARCH_SIZE = constants.ENDHDR + constants.MAXFILECOMMENT
+# Size of the first tail read when looking for the EOCD record.
+_EOCD_PROBE_SIZE = 4096
+# Local headers closer together than this are prefetched with a single read.
+_PREFETCH_WINDOW = 64 * 1024
+# Upper bound for the inflate buffer size hint taken from the (untrusted)
+# declared entry size; zlib grows the buffer past it when needed.
+_MAX_BUFSIZE_HINT = 2 * 1024 * 1024
+
 
 class StreamZip:
     def __init__(
@@ -32,11 +54,18 @@ class StreamZip:
         self.encoding = encoding
         self.store_entries = store_entries
         self.lazy_entries = lazy_entries
-        self.entries = {} if store_entries else None
+        # Stored entries are keyed by their raw filename bytes; the name-keyed
+        # `entries` mapping is built from them on first use.
+        self._entries = {} if store_entries else None
+        self._entries_by_name = None
         self.entries_count = 0
         self.comment = None
         self._file_path = None
         self._fp = None  # file pointer
+        self._mm = None  # read-only memory map of the file (path inputs only)
+        self._local_headers = {}  # prefetched local headers keyed by entry offset
+        # Serializes seek+read on platforms without os.pread.
+        self._io_lock = threading.Lock()
         self._central_dir_header = None
 
         # Open the file if a path is provided; otherwise, assume file-like object.
@@ -46,8 +75,15 @@ class StreamZip:
         else:
             self._fp = file
 
+        # Keep the descriptor for positional reads and the memory map.
+        self._fd = self._fp.fileno()
         # Get the file size (needed for scanning the EOCD record at the file tail).
-        self._file_size = os.fstat(self._fp.fileno()).st_size
+        self._file_size = os.fstat(self._fd).st_size
+
+        # Map files we opened ourselves, so random-access reads become slices of
+        # demand-paged memory rather than seek/read syscall pairs.
+        if self._file_path is not None and self._file_size:
+            self._mm = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)
 
         # Step 1: Locate and read the central directory (EOCD record).
         self._read_central_directory()
@@ -59,30 +95,32 @@ class StreamZip:
         Locate and parse the End-of-Central-Directory (EOCD) record.
 
         Process:
-          1. Determine the maximum number of bytes at the end of the file to search.
-          2. Seek to that area (file_size - read_size) and read it.
-          3. Search backwards for the EOCD signature.
+          1. Read a small probe from the end of the file, which holds the EOCD record
+             of any archive whose comment is short.
+          2. If no valid EOCD record is found there, read the maximum area the record
+             and comment can span (file_size - read_size).
+          3. Search backwards for an EOCD signature whose record ends at the end of the file.
           4. Extract the EOCD header and fill a CentralDirectoryHeader instance.
           5. Decode and store the ZIP comment (if any).
           6. Record the number of entries as specified in the header.
 
         Note: ZIP64 is not supported. If the header indicates ZIP64 values, an error is raised.
         """
-        max_comment = constants.MAXFILECOMMENT
-        eocd_search_size = (
-            constants.ENDHDR + max_comment
-        )  # maximum size for EOCD record plus comment
+        # Most archives have no comment, so the EOCD record sits in the last few bytes.
+        probe_size = min(_EOCD_PROBE_SIZE, self._file_size)
+        data = self._read_at(self._file_size - probe_size, probe_size)
+        pos = self._find_eocd(data, fallback=False)
+
         read_size = min(
-            eocd_search_size, self._file_size
+            _EOCD_SEARCH_SIZE, self._file_size
         )  # ensure we do not exceed file size
 
-        # Seek to the location where the EOCD record might be located.
-        self._fp.seek(self._file_size - read_size)
-        data = self._fp.read(read_size)
-
-        # Look for the EOCD signature in the data block (convert signature to little-endian bytes).
-        signature = constants.ENDSIG.to_bytes(4, byteorder="little")
-        pos = data.rfind(signature)
+        if pos < 0 and read_size > probe_size:
+            # Read the whole area where the EOCD record might be located.
+            data = self._read_at(self._file_size - read_size, read_size)
+            pos = self._find_eocd(data)
+        elif pos < 0:
+            pos = self._find_eocd(data)
         if pos < 0:
             raise ValueError("End of central directory signature not found")
 
@@ -114,6 +152,43 @@ class StreamZip:
         ):
             raise NotImplementedError("ZIP64 format not implemented in this version")
 
+    def _read_at(self, offset, size):
+        """
+        Return up to size bytes of the file starting at offset.
+        """
+        if self._mm is not None:
+            return self._mm[offset : offset + size]
+        if _HAS_PREAD:
+            # One positional syscall, atomic with respect to other threads.
+            return os.pread(self._fd, size, offset)
+        with self._io_lock:
+            self._fp.seek(offset)
+            return self._fp.read(size)
+
+    def _find_eocd(self, data, fallback=True):
+        """
+        Return the position of the EOCD record within data (the file tail), or -1.
+
+        Process:
+          1. Walk the EOCD signature candidates backwards from the end of data.
+          2. Accept the first candidate whose comment length makes the record end
+             exactly at the end of the file; this rejects signatures that appear
+             inside the ZIP comment.
+          3. If no candidate lines up (e.g. trailing bytes after the archive) and
+             fallback is True, fall back to the last signature found.
+        """
+        signature = _ENDSIG_BYTES
+        last = data.rfind(signature)
+        pos = last
+        while pos >= 0:
+            end = pos + constants.ENDHDR
+            if end <= len(data):
+                comment_length = utils.read_uint16_le(data, pos + constants.ENDCOM)
+                if end + comment_length == len(data):
+                    return pos
+            pos = data.rfind(signature, 0, pos)
+        return last if fallback else -1
+
     def _read_entries(self):
         """
         Read the central directory entries from the ZIP file.
@@ -121,25 +196,27 @@ class StreamZip:
         """
         cd_offset = self._central_dir_header.offset
         cd_size = self._central_dir_header.size
-        self._fp.seek(cd_offset)
+        entry_count = self._central_dir_header.volume_entries
+        # Bind loop invariants to locals; this loop runs once per entry.
+        cen_hdr = constants.CENHDR
+        encoding = self.encoding
+        entries = self._entries if self.store_entries else None
         if self.lazy_entries:
             # Use a memoryview to avoid unnecessary data copying.
-            cd_data = memoryview(self._fp.read(cd_size))
+            cd_data = memoryview(self._read_at(cd_offset, cd_size))
+            cd_len = len(cd_data)
             pos = 0
-            entry_count = self._central_dir_header.volume_entries
             for _ in range(entry_count):
                 # Each entry must have at least the fixed-size header
-                if pos + constants.CENHDR > len(cd_data):
+                if pos + cen_hdr > cd_len:
                     raise ValueError("Incomplete central directory entry")
                 entry = ZipEntry()
                 # Parse fixed header fields
                 entry.read_header(cd_data, pos)
-                pos_header_end = pos + constants.CENHDR
-                # Only decode the filename to enable indexing.
+                pos_header_end = pos + cen_hdr
+                # Only store the raw filename to enable indexing.
                 fname_data = cd_data[pos_header_end : pos_header_end + entry.fname_len]
-                entry.name = fname_data.tobytes().decode(
-                    self.encoding, errors="replace"
-                )
+                entry.set_raw_name(fname_data, encoding)
                 # Store lazy information for deferred parsing.
                 entry._cd_data = (
                     cd_data  # the entire central directory block (as memoryview)
@@ -152,33 +229,94 @@ class StreamZip:
                     False  # marks that extra and comment haven't been parsed yet
                 )
                 pos = pos_header_end + entry._variable_size
-                if self.store_entries:
-                    self.entries[entry.name] = entry
+                if entries is not None:
+                    entries[entry._name_bytes] = entry
         else:
-            cd_data = self._fp.read(cd_size)
-            pos = 0
-            entry_count = self._central_dir_header.volume_entries
-            for _ in range(entry_count):
-                if pos + constants.CENHDR > len(cd_data):
-                    raise ValueError("Incomplete central directory entry")
-                entry = ZipEntry()
-                entry.read_header(cd_data, pos)
-                pos += constants.CENHDR
-                variable_size = entry.fname_len + entry.extra_len + entry.com_len
-                if pos + variable_size > len(cd_data):
-                    raise ValueError("Corrupted central directory entry")
-                entry.read(cd_data, pos, self.encoding)
-                pos += variable_size
-                if self.store_entries:
-                    self.entries[entry.name] = entry
+            # Slices of a memoryview are zero-copy, so per-entry field access is free.
+            if self._mm is not None:
+                # Eager entries keep no reference into the buffer, so parse straight
+                # from the memory map instead of copying the whole directory out.
+                cd_data = memoryview(self._mm)[cd_offset : cd_offset + cd_size]
+            else:
+                cd_data = memoryview(self._read_at(cd_offset, cd_size))
+            try:
+                cd_len = len(cd_data)
+                pos = 0
+                for _ in range(entry_count):
+                    if pos + cen_hdr > cd_len:
+                        raise ValueError("Incomplete central directory entry")
+                    entry = ZipEntry()
+                    entry.read_header(cd_data, pos)
+                    pos += cen_hdr
+                    variable_size = entry.fname_len + entry.extra_len + entry.com_len
+                    if pos + variable_size > cd_len:
+                        raise ValueError("Corrupted central directory entry")
+                    entry.read(cd_data, pos, encoding)
+                    pos += variable_size
+                    if entries is not None:
+                        entries[entry._name_bytes] = entry
+            finally:
+                # Release the export so close() can unmap the file.
+                cd_data.release()
+
+    @property
+    def entries(self):
+        """
+        Dict of stored entries keyed by decoded name (None if storage is disabled).
+        Built on first access, which is the only point where every filename is decoded.
+        """
+        if self._entries is None:
+            return None
+        if self._entries_by_name is None:
+            self._entries_by_name = self._index_by_name()
+        return self._entries_by_name
+
+    def _index_by_name(self):
+        """
+        Build the name-keyed entry dict from the raw-bytes-keyed one.
+
+        Process:
+          1. For UTF-8 archives, join all raw names with NUL separators; if the result
+             is ASCII, decode and split it in one call instead of once per entry.
+          2. Use the name already set on an entry instead (e.g. by a Unicode path
+             extra field), keeping central directory order.
+          3. Otherwise (non-ASCII names, other encodings, NUL inside a name) decode
+             each entry's name individually.
+        """
+        entries = self._entries
+        if utils.is_utf8(self.encoding):
+            joined = b"\0".join(entries)
+            try:
+                names = joined.decode("ascii").split("\0")
+            except UnicodeDecodeError:
+                names = ()
+            if len(names) == len(entries):
+                values = entries.values()
+                # An already-set name (e.g. from a Unicode path extra) wins; keys
+                # are settled first so the dict keeps central directory order.
+                keys = [
+                    e._name if e._name is not None else n for n, e in zip(names, values)
+                ]
+                return dict(zip(keys, values))
+        return {e.name: e for e in entries.values()}
 
     def entry(self, name):
         """
-        Retrieve an entry by name from the stored entries.
+        Retrieve an entry by name (str or raw bytes) from the stored entries.
         """
         if not self.store_entries:
             raise ValueError("Entries storage is disabled")
-        return self.entries.get(name)
+        if isinstance(name, bytes):
+            return self._entries.get(name)
+        try:
+            entry_obj = self._entries.get(name.encode(self.encoding))
+        except UnicodeEncodeError:
+            entry_obj = None
+        if entry_obj is None:
+            # Names that do not round-trip through the encoding (e.g. replaced
+            # characters or Unicode path extra fields) need the decoded mapping.
+            entry_obj = self.entries.get(name)
+        return entry_obj
 
     def open_entry(self, entry):
         """
@@ -186,7 +324,7 @@ class StreamZip:
         Before processing, if the entry was lazy-loaded, ensure it has been fully parsed.
         Returns the data offset (position where file data starts).
         """
-        if isinstance(entry, str):
+        if isinstance(entry, (str, bytes)):
             entry_obj = self.entry(entry)
             if not entry_obj:
                 raise ValueError(f"Entry {entry} not found")
@@ -200,9 +338,10 @@ class StreamZip:
         if entry_obj.is_directory:
             raise ValueError("Entry is a directory")
 
-        self._fp.seek(entry_obj.offset)
-        local_header = self._fp.read(constants.LOCHDR)
-        if utils.read_uint32_le(local_header, 0) != constants.LOCSIG:
+        local_header = self._local_headers.pop(entry_obj.offset, None)
+        if local_header is None:
+            local_header = self._read_at(entry_obj.offset, constants.LOCHDR)
+        if local_header[:4] != _LOCSIG_BYTES:
             raise ValueError("Local header signature mismatch")
         entry_obj.read_data_header(local_header)
         data_offset = (
@@ -219,20 +358,27 @@ class StreamZip:
 
         Process:
           1. Open the entry to validate it and compute the data offset.
-          2. Seek to the data offset and read the number of bytes specified by compressed_size.
+          2. Read the number of bytes specified by compressed_size at the data offset.
           3. Depending on the compression method:
              - If STORED, the data is returned as-is.
-             - If DEFLATED, the data is decompressed using zlib.
+             - If DEFLATED, the data is decompressed using zlib (or python-isal when installed).
           4. Validate that the uncompressed data size matches the expected size.
           5. Optionally, perform a CRC check to ensure data integrity.
         """
         entry_obj, data_offset = self.open_entry(entry)
-        self._fp.seek(data_offset)
-        data = self._fp.read(entry_obj.compressed_size)
+        data = self._read_at(data_offset, entry_obj.compressed_size)
         if entry_obj.method == constants.STORED:
             result = data
         elif entry_obj.method == constants.DEFLATED:
-            result = zlib.decompress(data, -zlib.MAX_WBITS)
+            if _inflate_zlib is zlib:
+                # The size is known, so let zlib allocate the output buffer up
+                # front instead of growing it, within _MAX_BUFSIZE_HINT.
+                result = zlib.decompress(
+                    data, -zlib.MAX_WBITS, min(entry_obj.size, _MAX_BUFSIZE_HINT)
+                )
+            else:
+                # isal_zlib is slower with a presized buffer; use its own sizing.
+                result = _inflate_zlib.decompress(data, -zlib.MAX_WBITS)
         else:
             raise NotImplementedError(
                 f"Compression method {entry_obj.method} not supported"
@@ -248,10 +394,83 @@ class StreamZip:
                 raise ValueError("CRC check failed")
         return result
 
+    def extract_many(self, names, max_workers=None):
+        """
+        Read the data of several entries concurrently and return a dict mapping
+        each item of names (entry name or ZipEntry) to its uncompressed bytes.
+
+        Entries are independent and zlib releases the GIL while inflating, so the
+        work is spread over a thread pool, in order of the entries' file offsets.
+
+        :param names: Iterable of entry names (str or raw bytes) or ZipEntry objects.
+        :param max_workers: Thread pool size (ThreadPoolExecutor's default if None).
+        """
+        names = list(names)
+        entries = [
+            self.entry(name) if isinstance(name, (str, bytes)) else name
+            for name in names
+        ]
+        prefetched = self._prefetch_local_headers(entries)
+        # Submit in file order so the reads sweep the archive front to back;
+        # unknown names sort first and fail in entry_data_sync as usual.
+        order = sorted(
+            range(len(names)),
+            key=lambda i: -1 if entries[i] is None else entries[i].offset,
+        )
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    i: executor.submit(self.entry_data_sync, names[i]) for i in order
+                }
+                return {names[i]: futures[i].result() for i in range(len(names))}
+        finally:
+            # Drop headers no open_entry consumed (e.g. after a failed entry).
+            for offset in prefetched:
+                self._local_headers.pop(offset, None)
+
+    def _prefetch_local_headers(self, entries):
+        """
+        Read the local headers of several entries with as few reads as possible.
+
+        Process:
+          1. Sort the entries by local header offset.
+          2. Group headers that fit within one _PREFETCH_WINDOW-sized span.
+          3. Read each span once and cache every header in it for open_entry.
+
+        Directory entries are skipped, since open_entry rejects them before using a
+        header. Memory-mapped archives need no syscalls per header, so nothing is
+        prefetched. Returns the offsets of the cached headers.
+        """
+        if self._mm is not None:
+            return ()
+        offsets = sorted(
+            {e.offset for e in entries if e is not None and not e.is_directory}
+        )
+        i = 0
+        while i < len(offsets):
+            start = offsets[i]
+            j = i + 1
+            while (
+                j < len(offsets)
+                and offsets[j] + constants.LOCHDR - start <= _PREFETCH_WINDOW
+            ):
+                j += 1
+            end = offsets[j - 1] + constants.LOCHDR
+            window = self._read_at(start, end - start)
+            for offset in offsets[i:j]:
+                header = window[offset - start : offset - start + constants.LOCHDR]
+                if len(header) == constants.LOCHDR:
+                    self._local_headers[offset] = header
+            i = j
+        return offsets
+
     def close(self):
         """
-        Close the underlying file pointer.
+        Close the memory map and the underlying file pointer.
         """
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
         if self._fp:
             self._fp.close()
             self._fp = None
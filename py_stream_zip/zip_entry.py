@@ -1,16 +1,96 @@
 import struct
-import re
-from . import constants, utils
+from . import utils
+from .constants import (
+    CENHDR,
+    CENSIG,
+    EF_ZIP64_OR_16,
+    EF_ZIP64_OR_32,
+    ID_UNICODE_PATH,
+    ID_ZIP64,
+    LOCSIG,
+)
+from .utils import _u32_unpack_from as _u32
+from .utils import _u64_unpack_from as _u64
+
+# Raw local header signature, compared against the first four header bytes.
+_LOCSIG_BYTES = LOCSIG.to_bytes(4, "little")
+
+# Central directory file header layout (CENVEM..CENOFF), signature skipped.
+_CEN_STRUCT = struct.Struct("<4xHHHHHHIIIHHHHHII")
+# Local file header layout (LOCVER..LOCEXT), signature skipped.
+_LOC_STRUCT = struct.Struct("<4xHHHHHIIIHH")
+# Extra field sub-record header: signature, data size.
+_EXTRA_HDR = struct.Struct("<HH")
+# Complete ZIP64 extra field: size, compressed size, header offset, disk start.
+_Z64_FULL = struct.Struct("<QQQI")
+
+
+def _is_safe_raw_name(name_data):
+    """
+    Apply the validate_name checks to UTF-8 encoded name bytes.
+
+    In UTF-8 the bytes of "/", "\\", "." and ":" never occur inside a multi-byte
+    sequence, so these checks give the same answer as checking the decoded name.
+    Only a non-ASCII prefix before the first ":" is decoded, to tell whether it
+    consists of word characters.
+    """
+    if (
+        b"\\" in name_data
+        or name_data.startswith(b"/")
+        or b".." in name_data.split(b"/")
+    ):
+        return False
+    drive = name_data.find(b":")
+    if drive > 0:
+        head = str(name_data[:drive], "utf-8", "replace")
+        # "_" counts as a word character, like in a regex \w.
+        if head.replace("_", "a").isalnum():
+            return False
+    return True
 
 
 class ZipEntry:
+    # Fixed attribute set: no per-instance __dict__, which matters when a large
+    # central directory is held in memory.
+    __slots__ = (
+        "ver_made",
+        "version",
+        "flags",
+        "method",
+        "_timebytes",
+        "_datebytes",
+        "_time",
+        "crc",
+        "compressed_size",
+        "size",
+        "fname_len",
+        "extra_len",
+        "com_len",
+        "disk_start",
+        "inattr",
+        "attr",
+        "offset",
+        "_name_bytes",
+        "_name",
+        "_encoding",
+        "is_directory",
+        "comment",
+        "_cd_data",
+        "_variable_offset",
+        "_variable_size",
+        "_parsed_lazy",
+    )
+
     def __init__(self):
         # Initialize all attributes that will be filled when parsing an entry.
         self.ver_made = None
         self.version = None
         self.flags = None
         self.method = None
-        self.time = None
+        # The DOS time/date pair is kept raw and converted when `time` is read.
+        self._timebytes = None
+        self._datebytes = None
+        self._time = None
         self.crc = None
         self.compressed_size = None
         self.size = None
@@ -21,7 +101,10 @@ class ZipEntry:
         self.inattr = None
         self.attr = None
         self.offset = None
-        self.name = None
+        # The filename is kept as raw bytes and only decoded when `name` is read.
+        self._name_bytes = None
+        self._name = None
+        self._encoding = "utf-8"
         self.is_directory = False
         self.comment = None
         # Attributes used for lazy parsing:
@@ -30,6 +113,46 @@ class ZipEntry:
         # _variable_size: total size of variable-length fields.
         # _parsed_lazy: flag indicating whether lazy fields have been parsed.
 
+    @property
+    def name(self):
+        """The entry's filename, decoded from the raw bytes on first access."""
+        if self._name is None and self._name_bytes is not None:
+            # Positional errors argument: skips keyword parsing on this per-entry call.
+            self._name = self._name_bytes.decode(self._encoding, "replace")
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+
+    @property
+    def time(self):
+        """The modification time as a datetime, converted from the DOS fields on first access."""
+        if self._time is None and self._timebytes is not None:
+            self._time = utils.parse_zip_time(self._timebytes, self._datebytes)
+        return self._time
+
+    @time.setter
+    def time(self, value):
+        self._time = value
+
+    def set_raw_name(self, name_data, encoding="utf-8"):
+        """
+        Store the undecoded filename and derive the directory flag from it.
+        For UTF-8 names decoding is deferred until `name` is accessed.
+        """
+        name_bytes = self._name_bytes = bytes(name_data)
+        self._encoding = encoding
+        self._name = None
+        if utils.is_utf8(encoding):
+            # A trailing "/" (0x2F) or "\\" (0x5C) marks a directory; in UTF-8
+            # these bytes never occur inside a multi-byte character.
+            self.is_directory = bool(name_bytes) and name_bytes[-1] in (0x2F, 0x5C)
+        else:
+            # Elsewhere they can (cp932 "表" is 95 5C) or "/" is not one byte
+            # (UTF-16), so the decoded name has to be checked.
+            self.is_directory = self.name.endswith(("/", "\\"))
+
     def read_header(self, data, offset=0):
         """
         Read the fixed-size central directory header (46 bytes) from data starting at offset.
@@ -40,36 +163,29 @@ class ZipEntry:
              CRC, sizes, and the lengths of variable fields (filename, extra, comment).
           3. These values are stored in the corresponding attributes.
         """
-        if (
-            len(data) < offset + constants.CENHDR
-            or utils.read_uint32_le(data, offset) != constants.CENSIG
-        ):
+        if len(data) < offset + CENHDR or _u32(data, offset)[0] != CENSIG:
             raise ValueError("Invalid entry header")
-        # Read version information.
-        self.ver_made = struct.unpack_from("<H", data, offset + constants.CENVEM)[0]
-        self.version = struct.unpack_from("<H", data, offset + constants.CENVER)[0]
-        # Read general purpose bit flags.
-        self.flags = struct.unpack_from("<H", data, offset + constants.CENFLG)[0]
-        # Read compression method.
-        self.method = struct.unpack_from("<H", data, offset + constants.CENHOW)[0]
-        # Read the DOS-formatted time and date; convert to a Python datetime.
-        timebytes = struct.unpack_from("<H", data, offset + constants.CENTIM)[0]
-        datebytes = struct.unpack_from("<H", data, offset + constants.CENTIM + 2)[0]
-        self.time = utils.parse_zip_time(timebytes, datebytes)
-        # Extract CRC, compressed size, and uncompressed size.
-        self.crc = utils.read_uint32_le(data, offset + constants.CENCRC)
-        self.compressed_size = utils.read_uint32_le(data, offset + constants.CENSIZ)
-        self.size = utils.read_uint32_le(data, offset + constants.CENLEN)
-        # Read the lengths of the filename, extra field, and file comment.
-        self.fname_len = struct.unpack_from("<H", data, offset + constants.CENNAM)[0]
-        self.extra_len = struct.unpack_from("<H", data, offset + constants.CENEXT)[0]
-        self.com_len = struct.unpack_from("<H", data, offset + constants.CENCOM)[0]
-        # Read disk start number and file attributes.
-        self.disk_start = struct.unpack_from("<H", data, offset + constants.CENDSK)[0]
-        self.inattr = struct.unpack_from("<H", data, offset + constants.CENATT)[0]
-        self.attr = utils.read_uint32_le(data, offset + constants.CENATX)
-        # Get the offset to the local file header.
-        self.offset = utils.read_uint32_le(data, offset + constants.CENOFF)
+        # Unpack every fixed field in one call; the DOS time/date pair is only
+        # converted to a datetime when `time` is read.
+        (
+            self.ver_made,
+            self.version,
+            self.flags,
+            self.method,
+            self._timebytes,
+            self._datebytes,
+            self.crc,
+            self.compressed_size,
+            self.size,
+            self.fname_len,
+            self.extra_len,
+            self.com_len,
+            self.disk_start,
+            self.inattr,
+            self.attr,
+            self.offset,
+        ) = _CEN_STRUCT.unpack_from(data, offset)
+        self._time = None
 
     def read_data_header(self, data):
         """
@@ -78,54 +194,55 @@ class ZipEntry:
         Process:
           1. Ensure the local header has the correct signature.
           2. Parse version, flags, and compression method.
-          3. Convert the DOS timestamp into a datetime.
+          3. Store the DOS timestamp (converted to a datetime on access).
           4. Update CRC, compressed size, and uncompressed size if available.
           5. Read the lengths of the filename and extra field that follow the fixed header.
         """
-        if utils.read_uint32_le(data, 0) != constants.LOCSIG:
+        if data[:4] != _LOCSIG_BYTES:
             raise ValueError("Invalid local header")
-        self.version = struct.unpack_from("<H", data, constants.LOCVER)[0]
-        self.flags = struct.unpack_from("<H", data, constants.LOCFLG)[0]
-        self.method = struct.unpack_from("<H", data, constants.LOCHOW)[0]
-        timebytes = struct.unpack_from("<H", data, constants.LOCTIM)[0]
-        datebytes = struct.unpack_from("<H", data, constants.LOCTIM + 2)[0]
-        self.time = utils.parse_zip_time(timebytes, datebytes)
-        # Read the CRC; if 0, keep previously set value.
-        self.crc = utils.read_uint32_le(data, constants.LOCCRC) or self.crc
-        comp_size = utils.read_uint32_le(data, constants.LOCSIZ)
-        if comp_size and comp_size != constants.EF_ZIP64_OR_32:
+        (
+            self.version,
+            self.flags,
+            self.method,
+            self._timebytes,
+            self._datebytes,
+            crc,
+            comp_size,
+            size,
+            self.fname_len,
+            self.extra_len,
+        ) = _LOC_STRUCT.unpack_from(data, 0)
+        self._time = None
+        # Keep the CRC and sizes from the central directory when the local header
+        # leaves them unset (0) or defers them to a ZIP64 record.
+        self.crc = crc or self.crc
+        if comp_size and comp_size != EF_ZIP64_OR_32:
             self.compressed_size = comp_size
-        size = utils.read_uint32_le(data, constants.LOCLEN)
-        if size and size != constants.EF_ZIP64_OR_32:
+        if size and size != EF_ZIP64_OR_32:
             self.size = size
-        # Get lengths of the variable-length fields.
-        self.fname_len = struct.unpack_from("<H", data, constants.LOCNAM)[0]
-        self.extra_len = struct.unpack_from("<H", data, constants.LOCEXT)[0]
 
     def read(self, data, offset=0, encoding="utf-8"):
         """
         Read variable-length fields (filename, extra, comment) from data starting at offset.
 
         Process:
-          1. Decode the filename from the first fname_len bytes.
+          1. Store the filename from the first fname_len bytes (decoded lazily).
           2. Mark the entry as a directory if the name ends with "/" or "\\".
           3. Process extra field data if available.
           4. Decode the file comment if present.
         """
-        # Decode filename.
-        name_data = data[offset : offset + self.fname_len]
-        self.name = name_data.decode(encoding, errors="replace")
-        if self.name.endswith("/") or self.name.endswith("\\"):
-            self.is_directory = True
+        # Store the raw filename; it is decoded on first access.
+        self.set_raw_name(data[offset : offset + self.fname_len], encoding)
         current = offset + self.fname_len
         # Process the extra field if present.
         if self.extra_len:
-            self.read_extra(data[current : current + self.extra_len])
+            self.read_extra(data, current, current + self.extra_len)
             current += self.extra_len
         # Process the file comment if available.
         if self.com_len:
-            self.comment = data[current : current + self.com_len].decode(
-                encoding, errors="replace"
+            # str() decodes bytes and memoryview slices alike, without a copy.
+            self.comment = str(
+                data[current : current + self.com_len], encoding, "replace"
             )
         else:
             self.comment = None
@@ -133,13 +250,33 @@ class ZipEntry:
     def validate_name(self):
         """
         Reject suspicious or malicious file names.
+
+        A name is rejected if it contains a backslash, starts with "/", has a ".."
+        path component, or starts with a drive-like prefix (word characters then ":").
+        UTF-8 names that have not been decoded yet are checked on the raw bytes.
         """
-        if re.search(r"\\|^\w+:|^\/|(^|\/)\.\.(\/|$)", self.name):
-            raise ValueError(f"Malicious entry: {self.name}")
+        if (
+            self._name is None
+            and self._name_bytes is not None
+            and utils.is_utf8(self._encoding)
+        ):
+            if not _is_safe_raw_name(self._name_bytes):
+                raise ValueError(f"Malicious entry: {self.name}")
+            return
+        name = self.name
+        drive = name.find(":")
+        if (
+            "\\" in name
+            or name.startswith("/")
+            or ".." in name.split("/")
+            # "_" counts as a word character, like in a regex \w.
+            or (drive > 0 and name[:drive].replace("_", "a").isalnum())
+        ):
+            raise ValueError(f"Malicious entry: {name}")
 
-    def read_extra(self, data):
+    def read_extra(self, data, start=0, end=None):
         """
-        Parse the extra data block.
+        Parse the extra data block occupying data[start:end] (all of data by default).
 
         The extra block can contain several sub-fields. Each sub-field consists of:
           - A 2-byte signature indicating its type.
@@ -147,26 +284,23 @@ class ZipEntry:
           - The extra field data itself.
 
         This function iterates over the block and dispatches to appropriate handlers
-        based on the signature (e.g., ZIP64 or Unicode filename).
-        """
-        offset = 0
-        while offset < len(data):
-            if offset + 4 > len(data):
-                break
-            signature = struct.unpack_from("<H", data, offset)[0]
-            offset += 2
-            size = struct.unpack_from("<H", data, offset)[0]
-            offset += 2
-            block = data[offset : offset + size]
-            if signature == constants.ID_ZIP64:
-                self.parse_zip64_extra(block)
-            elif signature == constants.ID_UNICODE_PATH:
-                self.parse_unicode_filename(block)
+        based on the signature (e.g., ZIP64 or Unicode filename). The bounds are
+        walked in place and handed to the handlers, so no sub-field is sliced out.
+        """
+        if end is None:
+            end = len(data)
+        offset = start
+        while offset + 4 <= end:
+            signature, size = _EXTRA_HDR.unpack_from(data, offset)
+            offset += 4
+            handler = _EXTRA_HANDLERS.get(signature)
+            if handler is not None:
+                handler(self, data, offset, min(offset + size, end))
             offset += size
 
-    def parse_unicode_filename(self, data):
+    def parse_unicode_filename(self, data, start=0, end=None):
         """
-        Handle the extra field for a Unicode filename.
+        Handle the extra field for a Unicode filename, stored in data[start:end].
 
         The format is:
           - 1 byte for the version.
@@ -175,15 +309,16 @@ class ZipEntry:
 
         This routine decodes the filename from the provided block.
         """
-        if len(data) < 5:
+        if end is None:
+            end = len(data)
+        if end - start < 5:
             return
-        # version = data[0] (unused)
-        name_data = data[5:]
-        self.name = name_data.decode("utf-8", errors="replace")
+        # version = data[start] (unused)
+        self.name = str(data[start + 5 : end], "utf-8", "replace")
 
-    def parse_zip64_extra(self, data):
+    def parse_zip64_extra(self, data, start=0, end=None):
         """
-        Parse the ZIP64 extra field.
+        Parse the ZIP64 extra field stored in data[start:end].
 
         The order of values in the data block is:
           - Uncompressed size (8 bytes) if original size equals EF_ZIP64_OR_32.
@@ -192,19 +327,44 @@ class ZipEntry:
           - Disk start number (4 bytes) if original disk start equals EF_ZIP64_OR_16.
 
         Each field is read only if the corresponding value in the header was set to the placeholder.
+        When all four are placeholders, the 28-byte record is unpacked in one call;
+        when none are, the field is skipped without being read.
         """
-        offset = 0
-        if len(data) >= 8 and self.size == constants.EF_ZIP64_OR_32:
-            self.size = utils.read_uint64_le(data, offset)
+        if (
+            self.size != EF_ZIP64_OR_32
+            and self.compressed_size != EF_ZIP64_OR_32
+            and self.offset != EF_ZIP64_OR_32
+            and self.disk_start != EF_ZIP64_OR_16
+        ):
+            return
+        if end is None:
+            end = len(data)
+        if (
+            end - start == _Z64_FULL.size
+            and self.size == EF_ZIP64_OR_32
+            and self.compressed_size == EF_ZIP64_OR_32
+            and self.offset == EF_ZIP64_OR_32
+            and self.disk_start == EF_ZIP64_OR_16
+        ):
+            (
+                self.size,
+                self.compressed_size,
+                self.offset,
+                self.disk_start,
+            ) = _Z64_FULL.unpack_from(data, start)
+            return
+        offset = start
+        if end >= offset + 8 and self.size == EF_ZIP64_OR_32:
+            self.size = _u64(data, offset)[0]
             offset += 8
-        if len(data) >= offset + 8 and self.compressed_size == constants.EF_ZIP64_OR_32:
-            self.compressed_size = utils.read_uint64_le(data, offset)
+        if end >= offset + 8 and self.compressed_size == EF_ZIP64_OR_32:
+            self.compressed_size = _u64(data, offset)[0]
             offset += 8
-        if len(data) >= offset + 8 and self.offset == constants.EF_ZIP64_OR_32:
-            self.offset = utils.read_uint64_le(data, offset)
+        if end >= offset + 8 and self.offset == EF_ZIP64_OR_32:
+            self.offset = _u64(data, offset)[0]
             offset += 8
-        if len(data) >= offset + 4 and self.disk_start == constants.EF_ZIP64_OR_16:
-            self.disk_start = struct.unpack_from("<I", data, offset)[0]
+        if end >= offset + 4 and self.disk_start == EF_ZIP64_OR_16:
+            self.disk_start = _u32(data, offset)[0]
 
     def ensure_parsed(self, encoding="utf-8"):
         """
@@ -217,13 +377,19 @@ class ZipEntry:
         offset = self._variable_offset + self.fname_len
         # Parse extra field if available:
         if self.extra_len:
-            extra_bytes = self._cd_data[offset : offset + self.extra_len].tobytes()
-            self.read_extra(extra_bytes)
+            self.read_extra(self._cd_data, offset, offset + self.extra_len)
             offset += self.extra_len
         # Parse comment if available:
         if self.com_len:
-            comment_bytes = self._cd_data[offset : offset + self.com_len].tobytes()
-            self.comment = comment_bytes.decode(encoding, errors="replace")
+            comment_data = self._cd_data[offset : offset + self.com_len]
+            self.comment = str(comment_data, encoding, "replace")
         else:
             self.comment = None
         self._parsed_lazy = True
+
+
+# Extra field parsers by header ID; sub-records with other IDs are skipped.
+_EXTRA_HANDLERS = {
+    ID_ZIP64: ZipEntry.parse_zip64_extra,
+    ID_UNICODE_PATH: ZipEntry.parse_unicode_filename,
+}